@@ -5,9 +5,46 @@ Edit the settings below to customize the data download parameters.
 This file is shared between the prices and fundamentals scripts.
 """
 
+import functools
+import os
 from pathlib import Path
 from datetime import datetime, timedelta
 
+# Intervals accepted by yahooquery/yfinance (ordered copy kept for error messages)
+_VALID_INTERVAL_ORDER = ('1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h', '1d', '5d', '1wk', '1mo', '3mo')
+_VALID_INTERVALS = frozenset(_VALID_INTERVAL_ORDER)
+
+
+@functools.lru_cache(maxsize=1)
+def _validate_settings(tickers, start_date, end_date, interval):
+    """Validate one set of settings (invalid settings are not cached and raise every time)"""
+    errors = []
+    
+    # Check date format
+    try:
+        datetime.strptime(start_date, "%Y-%m-%d")
+        datetime.strptime(end_date, "%Y-%m-%d")
+    except ValueError:
+        errors.append("Dates must be in YYYY-MM-DD format")
+    
+    # Check date order
+    if start_date >= end_date:
+        errors.append("START_DATE must be before END_DATE")
+    
+    # Check tickers
+    if not tickers:
+        errors.append("TICKERS list cannot be empty")
+    
+    # Check interval
+    if interval not in _VALID_INTERVALS:
+        errors.append(f"INTERVAL must be one of: {', '.join(_VALID_INTERVAL_ORDER)}")
+    
+    if errors:
+        raise ValueError(f"Configuration errors: {'; '.join(errors)}")
+    
+    return True
+
+
 class Config:
     """Main configuration class"""
     
@@ -22,11 +59,11 @@ class Config:
         # "META",   # Meta Platforms Inc.
     ]
     
-   
-    
-    # Alternative: Dynamic dates (uncomment to use)
-    END_DATE = datetime.now().strftime("%Y-%m-%d")  # Today
-    START_DATE = (datetime.now() - timedelta(days=1825)).strftime("%Y-%m-%d")  # 5 years ago
+    # ---- Date Range ----
+    # Leave as None for dynamic dates, resolved when read via start_date()/end_date()
+    # Env vars INGEST_START_DATE / INGEST_END_DATE override both for deterministic runs
+    START_DATE = None  # Default: 5 years ago
+    END_DATE = None    # Default: today
     
     # ---- Data Parameters ----
     INTERVAL = "1d"  # Options: 1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo
@@ -63,6 +100,22 @@ class Config:
     LOG_TO_FILE = False
     LOG_DIR = PROJECT_ROOT / 'logs'
     
+    @classmethod
+    def start_date(cls, now=None):
+        """Resolve the start date (YYYY-MM-DD), relative to now if given"""
+        start = os.environ.get("INGEST_START_DATE") or cls.START_DATE
+        if start:
+            return start
+        return ((now or datetime.now()) - timedelta(days=1825)).strftime("%Y-%m-%d")
+    
+    @classmethod
+    def end_date(cls, now=None):
+        """Resolve the end date (YYYY-MM-DD), relative to now if given"""
+        end = os.environ.get("INGEST_END_DATE") or cls.END_DATE
+        if end:
+            return end
+        return (now or datetime.now()).strftime("%Y-%m-%d")
+    
     @classmethod
     def create_directories(cls):
         """Create all necessary directories"""
@@ -83,32 +136,9 @@ class Config:
     @classmethod
     def validate_config(cls):
         """Validate configuration settings"""
-        errors = []
-        
-        # Check date format
-        try:
-            datetime.strptime(cls.START_DATE, "%Y-%m-%d")
-            datetime.strptime(cls.END_DATE, "%Y-%m-%d")
-        except ValueError:
-            errors.append("Dates must be in YYYY-MM-DD format")
-        
-        # Check date order
-        if cls.START_DATE >= cls.END_DATE:
-            errors.append("START_DATE must be before END_DATE")
-        
-        # Check tickers
-        if not cls.TICKERS:
-            errors.append("TICKERS list cannot be empty")
-        
-        # Check interval
-        valid_intervals = ['1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h', '1d', '5d', '1wk', '1mo', '3mo']
-        if cls.INTERVAL not in valid_intervals:
-            errors.append(f"INTERVAL must be one of: {valid_intervals}")
-        
-        if errors:
-            raise ValueError(f"Configuration errors: {'; '.join(errors)}")
-        
-        return True
+        # Cached on the settings themselves, so repeat calls are free until one changes
+        now = datetime.now()
+        return _validate_settings(tuple(cls.TICKERS), cls.start_date(now), cls.end_date(now), cls.INTERVAL)
     
     @classmethod
     def summary(cls):
@@ -116,7 +146,8 @@ class Config:
         print("⚙️  Configuration Summary")
         print("=" * 40)
         print(f"Tickers: {', '.join(cls.TICKERS)}")
-        print(f"Date Range: {cls.START_DATE} to {cls.END_DATE}")
+        now = datetime.now()
+        print(f"Date Range: {cls.start_date(now)} to {cls.end_date(now)}")
         print(f"Interval: {cls.INTERVAL}")
         print(f"Individual files: {cls.SAVE_INDIVIDUAL_FILES}")
         print(f"Combined files: {cls.SAVE_COMBINED_FILES}")
@@ -2,7 +2,7 @@
 Investment Data Ingestion Script
 
 This script downloads price and fundamental data for specified stocks
-and saves them as CSV files for further analysis.
+and saves them as Parquet files (optionally CSV) for further analysis.
 
 Usage:
     python ingest_data.py
@@ -11,16 +11,22 @@ Configuration:
     Edit the TICKERS, START_DATE, END_DATE variables below
 """
 
+from __future__ import annotations
+
 import os
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 import json
-import pandas as pd
-from yahooquery import Ticker
-import yfinance as yf
 from pathlib import Path
 import argparse
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional
+
+# pandas and the Yahoo clients are slow to import, so they are loaded
+# inside the functions that use them
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 # ---- Configuration ----
@@ -28,11 +34,18 @@ class Config:
     """Configuration class to hold all settings"""
     # Default settings
     TICKERS = ["AAPL", "MSFT", "GOOGL"]  # Edit these as needed
-    START_DATE = "2020-01-01"
-        # (datetime.now() - timedelta(days=1825)).strftime("%Y-%m-%d")  # 5 years ago
-    END_DATE = datetime.now().strftime("%Y-%m-%d")  # Today
+    START_DATE = "2020-01-01"  # None = 5 years ago
+    END_DATE = None  # None = today (resolved when read via end_date())
     INTERVAL = "1d"
     SAVE_INDIVIDUAL = True
+    MAX_WORKERS = 8  # Concurrent requests within a batched download
+    WRITE_WORKERS = 4  # Concurrent per-ticker file writes
+    CACHE_MAX_AGE = 86400  # Seconds before a saved download is fetched again
+    SAVE_CSV = False  # Also write CSV copies next to the Parquet files
+    PARQUET_COMPRESSION = "zstd"
+    VALIDATE_TICKERS = True  # Skip tickers missing from the NASDAQ symbol list (disable for indices like ^GSPC)
+    SYMBOLS_MAX_AGE = 7 * 86400  # Seconds before the symbol list is refreshed (or a failed refresh retried)
+    SYMBOLS_TIMEOUT = (3.05, 10)  # (connect, read) seconds per symbol list request
     
     # Paths
     NB_CWD = Path.cwd()
@@ -40,8 +53,50 @@ class Config:
     DATA_DIR = PROJECT_ROOT / 'data' / 'raw'
     PRICES_DIR = DATA_DIR / "prices"
     FUNDS_DIR = DATA_DIR / "fundamentals"
+    SYMBOLS_CACHE = DATA_DIR / "valid_symbols.txt"
+    
+    @classmethod
+    def start_date(cls, now: Optional[datetime] = None) -> str:
+        """
+        Resolve the start date; INGEST_START_DATE env var takes precedence.
+        Pass now to share one clock reading with end_date().
+        """
+        start = os.environ.get("INGEST_START_DATE") or cls.START_DATE
+        if start:
+            return start
+        return ((now or datetime.now()) - timedelta(days=1825)).strftime("%Y-%m-%d")
+    
+    @classmethod
+    def end_date(cls, now: Optional[datetime] = None) -> str:
+        """
+        Resolve the end date; INGEST_END_DATE env var takes precedence.
+        Pass now to share one clock reading with start_date().
+        """
+        end = os.environ.get("INGEST_END_DATE") or cls.END_DATE
+        if end:
+            return end
+        return (now or datetime.now()).strftime("%Y-%m-%d")
 
 
+# yahooquery history column -> standard column, in output order
+COLUMN_MAPPING = {
+    'date': 'Date',
+    'open': 'Open',
+    'high': 'High',
+    'low': 'Low',
+    'close': 'Close',
+    'adjclose': 'Adj Close',
+    'volume': 'Volume',
+    'symbol': 'ticker',
+}
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Adj Close"]
+
+# NASDAQ screener downloads covering listed US stocks and ETFs
+SYMBOL_SOURCES = [
+    "https://api.nasdaq.com/api/screener/stocks?tableonly=true&download=true",
+    "https://api.nasdaq.com/api/screener/etf?tableonly=true&download=true",
+]
+
 
 def setup_directories():
     """Create necessary directories"""
@@ -53,189 +108,385 @@ def setup_directories():
     print(f"   Prices: {Config.PRICES_DIR}")
     print(f"   Fundamentals: {Config.FUNDS_DIR}")
 
+# ---- Ticker Validation ----
+def _is_fresh(path: Path, max_age: float) -> bool:
+    """Whether path exists and was modified less than max_age seconds ago"""
+    return path.exists() and time.time() - path.stat().st_mtime < max_age
+
+
+def _download_symbols() -> set:
+    """Download all listed symbols from the NASDAQ screener, in Yahoo format"""
+    import requests
+    
+    symbols = set()
+    for url in SYMBOL_SOURCES:
+        response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=Config.SYMBOLS_TIMEOUT)
+        response.raise_for_status()
+        
+        # Stocks list rows under data.rows, ETFs under data.data.rows
+        data = response.json().get("data") or {}
+        rows = data.get("rows") or (data.get("data") or {}).get("rows") or []
+        symbols.update(
+            row["symbol"].strip().upper().replace("/", "-")  # BRK/B -> BRK-B
+            for row in rows if row.get("symbol")
+        )
+    
+    if not symbols:
+        raise ValueError("symbol list download returned no symbols")
+    return symbols
+
+
+def refresh_symbols() -> Optional[set]:
+    """
+    Return the set of valid ticker symbols, refreshing the local cache when
+    it is older than Config.SYMBOLS_MAX_AGE. A stale cache is used if the
+    refresh fails; returns None when no symbol list is available at all.
+    A failed refresh is recorded in a marker file and not retried until the
+    marker is SYMBOLS_MAX_AGE old, so an unreachable endpoint costs one
+    timeout per period rather than one per run.
+    """
+    cache_path = Config.SYMBOLS_CACHE
+    failed_marker = cache_path.with_suffix(".failed")
+    if _is_fresh(cache_path, Config.SYMBOLS_MAX_AGE):
+        return set(cache_path.read_text().split())
+    
+    if not _is_fresh(failed_marker, Config.SYMBOLS_MAX_AGE):
+        try:
+            symbols = _download_symbols()
+            cache_path.write_text("\n".join(sorted(symbols)) + "\n")
+            failed_marker.unlink(missing_ok=True)
+            print(f"✅ Refreshed symbol list: {len(symbols)} symbols → {cache_path.name}")
+            return symbols
+        except Exception as e:
+            failed_marker.touch()
+            print(f"⚠️  Could not refresh symbol list: {e}")
+    
+    if cache_path.exists():
+        return set(cache_path.read_text().split())
+    return None
+
+# ---- Fallback using yfinance (if needed) ----
+def _fetch_yfinance(tickers: List[str], start: str, end: str, interval: str) -> pd.DataFrame:
+    """
+    Fetch price history with yfinance, shaped like yahooquery's history():
+    a (symbol, date) MultiIndex with lowercase column names.
+    """
+    import yfinance as yf
+    
+    df = yf.download(
+        tickers,
+        start=start,
+        end=end,
+        interval=interval,
+        group_by='ticker',
+        auto_adjust=False,  # Keep the Adj Close column
+        threads=True,
+        progress=False
+    )
+    if df.empty:
+        return df
+    
+    # Columns are (ticker, field); move ticker into the index
+    df = df.stack(level=0, future_stack=True).dropna(how='all')
+    df = df.swaplevel().sort_index().rename_axis(["symbol", "date"])
+    df.columns = [c.lower().replace(' ', '') for c in df.columns]
+    return df
+
 # ---- Download Prices Function (yahooquery - RECOMMENDED) ----
-def get_prices(tickers, start: str, end: str, interval: str = "1d", save: bool = True):
+def _download_history(tickers: List[str], start: str, end: str, interval: str,
+                      log: List[str]) -> pd.DataFrame:
+    """
+    Fetch price history for all tickers in one batched yahooquery request,
+    falling back to yfinance if the request fails or for any symbols that
+    fail individually.
+    Returns a tidy DataFrame in standard format (empty if nothing was downloaded).
+    Progress messages are appended to log, at most one per missing ticker.
+    """
+    import pandas as pd
+    from yahooquery import Ticker
+    
+    try:
+        log.append(f"📈 Downloading {', '.join(tickers)}...")
+        
+        ticker_obj = Ticker(tickers, asynchronous=True, max_workers=Config.MAX_WORKERS)
+        df = ticker_obj.history(start=start, end=end, interval=interval)
+    except Exception as e:
+        log.append(f"⚠️  yahooquery failed ({e}), retrying via yfinance...")
+        try:
+            df = _fetch_yfinance(tickers, start, end, interval)
+        except Exception as e:
+            log.append(f"❌ Error downloading {', '.join(tickers)}: {str(e)}")
+            return pd.DataFrame()
+    
+    # yahooquery returns a dict instead of a DataFrame when any symbol fails;
+    # retry just the failed symbols via yfinance and merge what comes back
+    failed = set()
+    if isinstance(df, dict):
+        frames = {tk: data for tk, data in df.items() if isinstance(data, pd.DataFrame)}
+        errors = {tk: data for tk, data in df.items() if tk not in frames}
+        if errors:
+            log.append(f"⚠️  yahooquery failed for {', '.join(errors)}, retrying via yfinance...")
+            try:
+                retried = _fetch_yfinance(list(errors), start, end, interval)
+            except Exception as e:
+                retried = pd.DataFrame()
+                log.append(f"⚠️  yfinance retry failed ({e})")
+            if not retried.empty:
+                frames.update((tk, part.droplevel(0)) for tk, part in retried.groupby(level=0))
+        for tk, error in errors.items():
+            if tk not in frames:
+                failed.add(tk)
+                log.append(f"❌ Error downloading {tk}: {error}")
+        df = pd.concat(frames, names=["symbol", "date"]) if frames else pd.DataFrame()
+    
+    # Tickers that came back empty without an error of their own
+    found = set(df.index.unique(level=0)) if not df.empty else set()
+    for tk in tickers:
+        if tk not in found and tk not in failed:
+            log.append(f"⚠️  No data found for {tk}")
+    
+    if df.empty:
+        return pd.DataFrame()
+    
+    # Flatten the (symbol, date) MultiIndex, then select and rename the
+    # available columns in one projection
+    df = df.reset_index()
+    src_columns = [c for c in COLUMN_MAPPING if c in df.columns]
+    df = df[src_columns]
+    df.columns = [COLUMN_MAPPING[c] for c in src_columns]
+    
+    # Ensure Date is datetime; intraday data already is, daily data holds
+    # datetime.date objects, so skip format inference either way
+    if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+        df['Date'] = pd.to_datetime(df['Date'], format='%Y-%m-%d', cache=True)
+    return _downcast_prices(df)
+
+
+def _downcast_prices(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store prices as float32 and volume as uint32 to halve memory and file size.
+    Volume keeps its original dtype if it has gaps or would overflow uint32.
+    """
+    price_columns = [c for c in PRICE_COLUMNS if c in df.columns]
+    df[price_columns] = df[price_columns].astype('float32')
+    
+    if 'Volume' in df.columns:
+        volume = df['Volume']
+        if volume.notna().all() and volume.min() >= 0 and volume.max() < 2**32:
+            df['Volume'] = volume.astype('uint32')
+    return df
+
+
+def _ticker_runs(df: pd.DataFrame, check_order: bool = True) -> Optional[dict]:
+    """
+    Map each ticker to the slice of rows it occupies. With check_order,
+    return None unless every ticker is one contiguous run sorted by Date.
+    """
+    ticker = df['ticker']
+    starts = ticker.ne(ticker.shift()).to_numpy().nonzero()[0].tolist()
+    bounds = starts + [len(df)]
+    
+    runs = {}
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        tk = ticker.iat[start]
+        if check_order and (tk in runs or not df['Date'].iloc[start:stop].is_monotonic_increasing):
+            return None
+        runs[tk] = slice(start, stop)
+    return runs
+
+
+def _save_ticker_prices(ticker_df: pd.DataFrame, filepath: Path) -> None:
+    """Write one ticker's prices to Parquet (and CSV if Config.SAVE_CSV)"""
+    ticker_df.to_parquet(filepath, index=False, compression=Config.PARQUET_COMPRESSION)
+    if Config.SAVE_CSV:
+        ticker_df.to_csv(filepath.with_suffix('.csv'), index=False)
+
+
+def get_prices(tickers, start: str, end: str, interval: str = "1d", save: bool = True,
+               combined_path: Optional[Path] = None):
     """
     Download tidy daily OHLCV for a list of tickers using yahooquery.
-    Returns one long/tidy DataFrame and (optionally) writes per-ticker CSVs.
+    Tickers saved by a recent run are loaded from disk; the rest are fetched
+    in one batched request. Returns one long/tidy DataFrame and (optionally)
+    writes per-ticker Parquet files, which double as the download cache.
+    With combined_path, the combined data is streamed to that Parquet file
+    ticker by ticker instead of being concatenated in memory.
     
     Args:
         tickers: List of ticker symbols or single ticker string
         start: Start date in YYYY-MM-DD format
         end: End date in YYYY-MM-DD format
         interval: Data interval (default "1d")
-        save: Whether to save individual CSV files
+        save: Whether to save individual Parquet files
+        combined_path: Optional Parquet file to stream the combined data into
     
     Returns:
         pd.DataFrame: Combined tidy DataFrame with all ticker data
     """
+    import pandas as pd
+    
     if isinstance(tickers, str):
         tickers = [tickers]
     
-    all_prices = []
-    ordered_columns = ["Date", "Open", "High", "Low", "Close", "Adj Close", "Volume", "ticker"]
-    
-    for tk in tickers:
-        try:
-            print(f"📈 Downloading {tk}...")
-            
-            ticker_obj = Ticker(tk)
-            df = ticker_obj.history(start=start, end=end, interval=interval)
-            
-            if df.empty:
-                print(f"⚠️  No data found for {tk}")
-                continue
-            
-            # Reset index to get date as column
-            df = df.reset_index()
-            
-            # Add ticker column
-            df["ticker"] = tk
-            
-            # Rename columns to match standard format
-            column_mapping = {
-                'date': 'Date',
-                'open': 'Open', 
-                'high': 'High',
-                'low': 'Low',
-                'close': 'Close',
-                'adjclose': 'Adj Close',
-                'volume': 'Volume'
-            }
-            df = df.rename(columns=column_mapping)
-            
-            # Keep only available columns
-            available_columns = [c for c in ordered_columns if c in df.columns]
-            df = df[available_columns]
-            
-            # Ensure Date is datetime
-            if 'Date' in df.columns:
-                df['Date'] = pd.to_datetime(df['Date'])
-                df = df.sort_values('Date')
-            
-            if save:
-                clean_start = start.replace('-', '')
-                clean_end = end.replace('-', '')
-                filename = f"{tk.lower()}_{clean_start}_{clean_end}_{interval}.csv"
-                filepath = Config.PRICES_DIR / filename
-                df.to_csv(filepath, index=False)
-                print(f"✅ Saved {len(df)} records for {tk} → {filename}")
-            
-            all_prices.append(df)
-            
-        except Exception as e:
-            print(f"❌ Error downloading {tk}: {str(e)}")
-            continue
-    
-    if all_prices:
-        combined = pd.concat(all_prices, ignore_index=True)
-        if 'Date' in combined.columns and 'ticker' in combined.columns:
-            combined = combined.sort_values(['ticker', 'Date']).reset_index(drop=True)
+    # Progress is collected and written once, so it costs one stdout write
+    # per call instead of several per ticker
+    log = []
+    try:
+        # Per-ticker filenames only differ by ticker, so build the rest once
+        clean_start = start.replace('-', '')
+        clean_end = end.replace('-', '')
+        suffix = f"_{clean_start}_{clean_end}_{interval}.parquet"
+        
+        def ticker_path(tk: str) -> Path:
+            return Config.PRICES_DIR / (tk.lower() + suffix)
+        
+        # Per-ticker data, each already sorted by Date: a cached file path or a fresh frame
+        ticker_prices = {}
+        
+        # Reuse per-ticker files from a previous run with the same parameters
+        to_download = []
+        for tk in tickers:
+            cache_path = ticker_path(tk)
+            if cache_path.exists() and time.time() - cache_path.stat().st_mtime < Config.CACHE_MAX_AGE:
+                ticker_prices[tk] = cache_path
+                log.append(f"📦 Using cached {tk} → {cache_path.name}")
+            else:
+                to_download.append(tk)
+        
+        df = _download_history(to_download, start, end, interval, log) if to_download else pd.DataFrame()
+        if not df.empty:
+            # Each ticker's frame is a row slice (a view) of the batch, not a copy.
+            # Both sources return every symbol as one date-ordered run, so the
+            # batch is only sorted (a full copy) when that does not hold
+            runs = _ticker_runs(df)
+            if runs is None:
+                df = df.sort_values(['ticker', 'Date'], ignore_index=True)
+                runs = _ticker_runs(df, check_order=False)
+            for tk, rows in runs.items():
+                ticker_prices[tk] = df.iloc[rows]
+        del df  # The batch is freed once the last slice has been streamed
+        
+        if not ticker_prices:
+            log.append("⚠️  No data was successfully downloaded")
+            return pd.DataFrame()
         
-        print(f"🎉 Successfully combined data for {len(combined['ticker'].unique())} tickers, {len(combined)} total records")
+        # File writes release the GIL, so write the downloaded tickers concurrently
+        jobs = [
+            (tk, ticker_df, ticker_path(tk))
+            for tk, ticker_df in ticker_prices.items()
+            if not isinstance(ticker_df, Path)
+        ]
+        if save and jobs:
+            with ThreadPoolExecutor(max_workers=Config.WRITE_WORKERS) as executor:
+                # list() waits for every write and re-raises any write error
+                list(executor.map(lambda job: _save_ticker_prices(job[1], job[2]), jobs))
+            for tk, ticker_df, filepath in jobs:
+                log.append(f"✅ Saved {len(ticker_df)} records for {tk} → {filepath.name}")
+        del jobs  # Keep ticker_prices as the only reference to each frame
+        
+        # Tickers in sorted order, each sorted by Date, gives the (ticker, Date) order without a global sort
+        n_tickers = len(ticker_prices)
+        if combined_path is not None:
+            combined = _stream_combined_prices(ticker_prices, combined_path)
+        else:
+            combined = pd.concat(
+                [pd.read_parquet(part) if isinstance(part, Path) else part
+                 for _, part in sorted(ticker_prices.items())],
+                ignore_index=True
+            )
+        
+        log.append(f"🎉 Successfully combined data for {n_tickers} tickers, {len(combined)} total records")
         return combined
-    else:
-        print("⚠️  No data was successfully downloaded")
-        return pd.DataFrame()
+    finally:
+        if log:
+            sys.stdout.write('\n'.join(log) + '\n')
 
-# ---- Fallback using yfinance (if needed) ----
-def get_prices_yfinance_fallback(tickers, start: str, end: str, interval: str = "1d", save: bool = True):
+
+def _stream_combined_prices(ticker_prices: dict, combined_path: Path) -> pd.DataFrame:
     """
-    Fallback function using yfinance if yahooquery fails.
+    Append each ticker's prices (a cached file path or a frame) to the
+    combined Parquet file as its own row group, in ticker order, then read
+    the finished file back.
+    
+    ticker_prices is consumed: each part is removed once written, so the
+    downloaded batch is released before the file is read back.
     """
-    if isinstance(tickers, str):
-        tickers = [tickers]
+    import pyarrow as pa
+    import pyarrow.parquet as pq
     
-    all_prices = []
-    ordered_columns = ["Date", "Open", "High", "Low", "Close", "Adj Close", "Volume", "ticker"]
+    # Parts can differ in Volume dtype (see _downcast_prices) or in which
+    # columns they have, so every row group is written with one unified schema
+    schemas = [
+        pq.read_schema(part) if isinstance(part, Path) else pa.Schema.from_pandas(part, preserve_index=False)
+        for part in ticker_prices.values()
+    ]
+    schema = pa.unify_schemas([s.remove_metadata() for s in schemas], promote_options='permissive')
+    output_order = list(COLUMN_MAPPING.values())
+    schema = pa.schema(sorted(
+        schema, key=lambda f: output_order.index(f.name) if f.name in output_order else len(output_order)
+    ))
     
-    for tk in tickers:
-        try:
-            print(f"📈 Downloading {tk} via yahooquery...")
-            
-            ticker_obj = Ticker(tk)
-            df = ticker_obj.history(start=start, end=end, interval=interval)
-            
-            if df.empty:
-                print(f"⚠️  No data found for {tk}")
-                continue
-            
-            # Reset index to get date as column
-            df = df.reset_index()
-            
-            # Add ticker column
-            df["ticker"] = tk
-            
-            # Rename columns to match yfinance format
-            column_mapping = {
-                'date': 'Date',
-                'open': 'Open', 
-                'high': 'High',
-                'low': 'Low',
-                'close': 'Close',
-                'adjclose': 'Adj Close',
-                'volume': 'Volume'
-            }
-            df = df.rename(columns=column_mapping)
-            
-            # Keep only available columns
-            available_columns = [c for c in ordered_columns if c in df.columns]
-            df = df[available_columns]
-            
-            # Ensure Date is datetime
-            if 'Date' in df.columns:
-                df['Date'] = pd.to_datetime(df['Date'])
-                df = df.sort_values('Date')
-            
-            if save:
-                clean_start = start.replace('-', '')
-                clean_end = end.replace('-', '')
-                filename = f"{tk.lower()}_{clean_start}_{clean_end}_{interval}_yq.csv"
-                filepath = Config.PRICES_DIR / filename
-                df.to_csv(filepath, index=False)
-                print(f"✅ Saved {len(df)} records for {tk} → {filename}")
-            
-            all_prices.append(df)
-            
-        except Exception as e:
-            print(f"❌ Error downloading {tk}: {str(e)}")
-            continue
+    with pq.ParquetWriter(combined_path, schema, compression=Config.PARQUET_COMPRESSION) as writer:
+        for tk in sorted(ticker_prices):
+            part = ticker_prices.pop(tk)
+            if isinstance(part, Path):
+                table = pq.read_table(part)
+            else:
+                table = pa.Table.from_pandas(part, preserve_index=False)
+            del part
+            writer.write_table(_conform_table(table, schema))
+            del table
     
-    if all_prices:
-        combined = pd.concat(all_prices, ignore_index=True)
-        if 'Date' in combined.columns and 'ticker' in combined.columns:
-            combined = combined.sort_values(['ticker', 'Date']).reset_index(drop=True)
-        
-        print(f"🎉 Successfully combined data for {len(combined['ticker'].unique())} tickers, {len(combined)} total records")
-        return combined
-    else:
-        return pd.DataFrame()
+    return pq.read_table(combined_path).to_pandas()
+
+
+def _conform_table(table, schema):
+    """Cast a part's columns to the unified schema, filling missing columns with nulls"""
+    import pyarrow as pa
     
-def save_combined_prices(prices_df: pd.DataFrame, start_date: str, end_date: str) -> None:
-    """Save combined price data to CSV"""
+    columns = [
+        table.column(field.name).cast(field.type) if field.name in table.column_names
+        else pa.nulls(len(table), field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def combined_prices_path(start_date: str, end_date: str) -> Path:
+    """Path of the combined Parquet file for a date range"""
+    clean_start = start_date.replace('-', '')
+    clean_end = end_date.replace('-', '')
+    return Config.PRICES_DIR / f"combined_prices_{clean_start}_{clean_end}.parquet"
+
+def save_combined_prices(prices_df: pd.DataFrame, start_date: str, end_date: str,
+                         write_parquet: bool = True) -> None:
+    """
+    Save combined price data to Parquet (and CSV if Config.SAVE_CSV).
+    Pass write_parquet=False when get_prices already streamed the Parquet file.
+    """
     if not prices_df.empty:
-        clean_start = start_date.replace('-', '')
-        clean_end = end_date.replace('-', '')
-        
-        combined_filename = f"combined_prices_{clean_start}_{clean_end}.csv"
-        combined_filepath = Config.PRICES_DIR / combined_filename
+        combined_filepath = combined_prices_path(start_date, end_date)
         
-        prices_df.to_csv(combined_filepath, index=False)
-        print(f"✅ Saved combined data: {combined_filename}")
+        if write_parquet:
+            prices_df.to_parquet(combined_filepath, index=False, compression=Config.PARQUET_COMPRESSION)
+        print(f"✅ Saved combined data: {combined_filepath.name}")
         print(f"📊 Total records: {len(prices_df)}")
-        print(f"📈 Tickers: {', '.join(prices_df['ticker'].unique())}")
         
-        # Optional: Save as pickle for faster loading
-        pickle_filepath = Config.PRICES_DIR / f"combined_prices_{clean_start}_{clean_end}.pkl"
-        prices_df.to_pickle(pickle_filepath)
-        print(f"✅ Also saved as pickle: {pickle_filepath.name}")
+        # One pass over the frame for all per-ticker counts
+        counts = prices_df.groupby('ticker', sort=True).size()
+        print(f"📈 Tickers: {', '.join(counts.index)}")
+        
+        # Optional: CSV copy for tools that can't read Parquet
+        if Config.SAVE_CSV:
+            csv_filepath = combined_filepath.with_suffix('.csv')
+            prices_df.to_csv(csv_filepath, index=False)
+            print(f"✅ Also saved as CSV: {csv_filepath.name}")
         
         # Data summary
         print(f"\n📋 Data Summary:")
         print(f"Date range: {prices_df['Date'].min().date()} to {prices_df['Date'].max().date()}")
         print(f"Records per ticker:")
-        for ticker in sorted(prices_df['ticker'].unique()):
-            count = len(prices_df[prices_df['ticker'] == ticker])
+        for ticker, count in counts.items():
             print(f"  {ticker}: {count} records")
     else:
         print("⚠️ No data to save - combined DataFrame is empty")
@@ -248,10 +499,11 @@ def main():
     # Setup directories
     setup_directories()
     
-    # Use config values directly
+    # Use config values directly; read the clock once so both dates agree
+    now = datetime.now()
     tickers = Config.TICKERS
-    start_date = Config.START_DATE
-    end_date = Config.END_DATE
+    start_date = Config.start_date(now)
+    end_date = Config.end_date(now)
     interval = Config.INTERVAL
     save_individual = Config.SAVE_INDIVIDUAL
     
@@ -273,21 +525,23 @@ def main():
     print(f"   Save individual files: {save_individual}")
     print("")
     
-    # Download price data
-    print("📈 Starting price data download...")
-    price_results = []
+    # Drop unknown/delisted tickers before spending a request on them
+    valid_symbols = refresh_symbols() if Config.VALIDATE_TICKERS else None
+    if valid_symbols is not None:
+        skipped = [tk for tk in tickers if tk.upper() not in valid_symbols]
+        tickers = [tk for tk in tickers if tk.upper() in valid_symbols]
+        if skipped:
+            print(f"⚠️  Skipping invalid tickers: {', '.join(skipped)}")
     
-    for tk in tickers:
-        try:
-            dfp = get_prices([tk], start_date, end_date, interval, save=save_individual)
-            if not dfp.empty:
-                price_results.append(dfp)
-        except Exception as e:
-            print(f"❌ Price fetch failed for {tk}: {e}")
+    # Download price data (one batched request for all tickers), streaming
+    # the combined Parquet file as it goes
+    print("📈 Starting price data download...")
+    combined_path = combined_prices_path(start_date, end_date)
+    prices_df = get_prices(tickers, start_date, end_date, interval, save=save_individual,
+                           combined_path=combined_path)
     
-    # Combine and save price data
-    prices_df = pd.concat(price_results, ignore_index=True) if price_results else pd.DataFrame()
-    save_combined_prices(prices_df, start_date, end_date)
+    # Save the remaining combined outputs and print the summary
+    save_combined_prices(prices_df, start_date, end_date, write_parquet=False)
     
     print(f"\n✅ Script completed successfully!")
     return prices_df